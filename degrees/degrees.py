@@ -1,17 +1,80 @@
 """Command-line interface to find degrees of separation between two actors."""
 
 import argparse
-import csv
 import os
 import sys
 from typing import Dict, List, Optional, Set, Tuple
 
-from util import Node, QueueFrontier
+import numpy as np
+import pandas as pd
 
-# Global data containers populated by load_data
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; BFS falls back to pure Python
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # PyArrow is optional; pandas parses the CSVs
+    pacsv = None
+
+# Global data containers populated by load_data. Records are plain
+# lists -- people: [name, birth, movies_set], movies: [title, year,
+# stars_set] -- so field access is C-level indexing rather than a dict
+# probe, at roughly half the memory per record.
 names: Dict[str, Set[str]] = {}
-people: Dict[str, Dict[str, object]] = {}
-movies: Dict[str, Dict[str, object]] = {}
+people: Dict[str, List[object]] = {}
+movies: Dict[str, List[object]] = {}
+
+# Compact integer indexing: string ids stay the external interface, BFS
+# runs on contiguous int32 indices so the whole graph fits in cache.
+person_index: Dict[str, int] = {}
+person_ids: List[str] = []
+movie_index: Dict[str, int] = {}
+movie_ids: List[str] = []
+
+# CSR adjacency arrays: person -> movies and movie -> persons.
+pm_indptr = np.zeros(1, dtype=np.int32)
+pm_indices = np.zeros(0, dtype=np.int32)
+mp_indptr = np.zeros(1, dtype=np.int32)
+mp_indices = np.zeros(0, dtype=np.int32)
+
+# BFS scratch buffers sized by _build_graph and reused across queries;
+# after each search only the touched entries are reset, so repeated
+# calls cost O(visited) rather than O(n_people) in allocations.
+_scratch: Dict[str, np.ndarray] = {}
+
+
+# Every CSV column is read as plain strings; ids must not be coerced
+# to integers and empty fields stay "" rather than NaN/null.
+_CSV_COLUMN_NAMES = ("id", "name", "birth", "title", "year",
+                     "person_id", "movie_id")
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    """Read a CSV file into a DataFrame of string columns.
+
+    Summary:
+        Uses PyArrow's multithreaded CSV reader when it is installed,
+        converting the Arrow table to pandas for the callers; falls
+        back to pandas' single-threaded C parser otherwise. Either way
+        ids stay strings and missing fields are empty strings.
+    Params:
+        path: Path of the CSV file to read.
+    Outputs:
+        DataFrame with one string column per CSV column.
+    """
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in _CSV_COLUMN_NAMES}
+            ),
+        )
+        return table.to_pandas()
+    return pd.read_csv(path, dtype=str, na_filter=False)
 
 
 def load_data(directory: str) -> None:
@@ -26,52 +89,118 @@ def load_data(directory: str) -> None:
         Populates module-level dictionaries `names`, `people`, and `movies`.
     """
     # Load people
-    with open(os.path.join(directory, "people.csv"), encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            people[row["id"]] = {
-                "name": row["name"],
-                "birth": row["birth"],
-                "movies": set(),
-            }
-            key = row["name"].lower()
-            if key not in names:
-                names[key] = {row["id"]}
-            else:
-                names[key].add(row["id"])
+    df = _read_csv(os.path.join(directory, "people.csv"))
+    # Lowercase all names in one vectorized pass; setdefault avoids the
+    # per-row membership branch in the tightest startup loop.
+    lowered = df["name"].str.lower()
+    for pid, name, birth, key in zip(df["id"], df["name"], df["birth"], lowered):
+        # Intern ids so each exists once in memory, hashes once, and
+        # compares by pointer across every dict, set, and BFS probe.
+        pid = sys.intern(pid)
+        people[pid] = [name, birth, set()]
+        names.setdefault(key, set()).add(pid)
 
     # Load movies
-    with open(os.path.join(directory, "movies.csv"), encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            movies[row["id"]] = {
-                "title": row["title"],
-                "year": row["year"],
-                "stars": set(),
-            }
+    df = _read_csv(os.path.join(directory, "movies.csv"))
+    for mid, title, year in zip(df["id"], df["title"], df["year"]):
+        mid = sys.intern(mid)
+        movies[mid] = [title, year, set()]
 
     # Load stars
-    with open(os.path.join(directory, "stars.csv"), encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                people[row["person_id"]]["movies"].add(row["movie_id"])
-                movies[row["movie_id"]]["stars"].add(row["person_id"])
-            except KeyError:
-                # Skip rows with missing references
-                continue
+    df = _read_csv(os.path.join(directory, "stars.csv"))
+    for pid, mid in zip(df["person_id"], df["movie_id"]):
+        try:
+            pid = sys.intern(pid)
+            mid = sys.intern(mid)
+            people[pid][2].add(mid)
+            movies[mid][2].add(pid)
+        except KeyError:
+            # Skip rows with missing references
+            continue
+
+    _build_graph()
+
+
+def _build_graph() -> None:
+    """Compact ids to int32 indices and build CSR adjacency arrays.
+
+    Summary:
+        Assigns each person and movie a contiguous integer index, then
+        packs person->movie and movie->person adjacency into CSR
+        (indptr/indices) NumPy arrays. BFS then runs as a tight integer
+        loop over a few MB of contiguous memory instead of hashing
+        string keys through nested dicts.
+    Params:
+        None; reads the module-level `people` and `movies` dicts.
+    Outputs:
+        Populates `person_index`/`person_ids`, `movie_index`/`movie_ids`
+        and the four module-level CSR arrays.
+    """
+    global pm_indptr, pm_indices, mp_indptr, mp_indices
+
+    person_ids[:] = list(people)
+    person_index.clear()
+    person_index.update((pid, i) for i, pid in enumerate(person_ids))
+    movie_ids[:] = list(movies)
+    movie_index.clear()
+    movie_index.update((mid, i) for i, mid in enumerate(movie_ids))
+
+    pm_indptr = np.zeros(len(person_ids) + 1, dtype=np.int32)
+    for i, pid in enumerate(person_ids):
+        pm_indptr[i + 1] = pm_indptr[i] + len(people[pid][2])
+    pm_indices = np.empty(pm_indptr[-1], dtype=np.int32)
+    for i, pid in enumerate(person_ids):
+        start = pm_indptr[i]
+        for j, movie_id in enumerate(people[pid][2]):
+            pm_indices[start + j] = movie_index[movie_id]
+
+    mp_indptr = np.zeros(len(movie_ids) + 1, dtype=np.int32)
+    for i, mid in enumerate(movie_ids):
+        mp_indptr[i + 1] = mp_indptr[i] + len(movies[mid][2])
+    mp_indices = np.empty(mp_indptr[-1], dtype=np.int32)
+    for i, mid in enumerate(movie_ids):
+        start = mp_indptr[i]
+        for j, star_id in enumerate(movies[mid][2]):
+            mp_indices[start + j] = person_index[star_id]
+
+    # Scratch buffers for shortest_path; parent == -1 and the zeroed
+    # byte-maps are the between-queries invariant that _reset_scratch
+    # restores after each search.
+    n_people = len(person_ids)
+    n_movies = len(movie_ids)
+    _scratch["parent_s"] = np.full(n_people, -1, dtype=np.int32)
+    _scratch["parent_t"] = np.full(n_people, -1, dtype=np.int32)
+    _scratch["action_s"] = np.empty(n_people, dtype=np.int32)
+    _scratch["action_t"] = np.empty(n_people, dtype=np.int32)
+    _scratch["seen_s"] = np.zeros(n_people, dtype=np.uint8)
+    _scratch["seen_t"] = np.zeros(n_people, dtype=np.uint8)
+    _scratch["seen_movies_s"] = np.zeros(n_movies, dtype=np.uint8)
+    _scratch["seen_movies_t"] = np.zeros(n_movies, dtype=np.uint8)
+    _scratch["cur_s"] = np.empty(n_people, dtype=np.int32)
+    _scratch["nxt_s"] = np.empty(n_people, dtype=np.int32)
+    _scratch["cur_t"] = np.empty(n_people, dtype=np.int32)
+    _scratch["nxt_t"] = np.empty(n_people, dtype=np.int32)
+    # Each side touches a person/movie at most once, plus the two roots.
+    _scratch["touched_p"] = np.empty(2 * n_people + 2, dtype=np.int32)
+    _scratch["touched_m"] = np.empty(2 * n_movies, dtype=np.int32)
 
 
 def person_id_for_name(name: str) -> Optional[str]:
     """Resolve a name to a unique person id if possible.
 
     Summary:
-        Handles ambiguous names by prompting the user to select one ID.
+        Returns the input unchanged when it is already a known person
+        id; otherwise handles ambiguous names by prompting the user to
+        select one ID.
     Params:
-        name: Name string typed by the user.
+        name: Name or person id string typed by the user.
     Outputs:
         Returns a person id string or None if no match exists.
     """
+    # Fast path: the input is already a person id.
+    if name in people:
+        return name
+
     person_ids = list(names.get(name.lower(), set()))
     if not person_ids:
         return None
@@ -82,7 +211,7 @@ def person_id_for_name(name: str) -> Optional[str]:
     print(f"Which '{name}'?")
     for person_id in person_ids:
         person = people[person_id]
-        print(f"ID: {person_id}, Name: {person['name']}, Birth: {person['birth']}")
+        print(f"ID: {person_id}, Name: {person[0]}, Birth: {person[1]}")
     try:
         choice = input("Intended Person ID: ")
     except EOFError:
@@ -90,31 +219,241 @@ def person_id_for_name(name: str) -> Optional[str]:
     return choice if choice in person_ids else None
 
 
-def neighbors_for_person(person_id: str) -> Set[Tuple[str, str]]:
+def neighbors_for_person(person_id: str) -> List[Tuple[str, str]]:
     """Return (movie_id, person_id) pairs for people who starred together.
 
     Summary:
-        Iterates over every movie the person appeared in and collects
-        co-stars associated with that movie.
+        Walks the CSR adjacency built by load_data and maps the integer
+        indices back to string ids. BFS itself stays on the integer
+        arrays; this helper is for callers who want string pairs.
     Params:
         person_id: ID of the person whose neighbors we want.
     Outputs:
-        A set of (movie_id, neighbor_person_id) tuples.
+        A list of (movie_id, neighbor_person_id) tuples.
+    """
+    pidx = person_index[person_id]
+    pairs: List[Tuple[str, str]] = []
+    for m in pm_indices[pm_indptr[pidx]:pm_indptr[pidx + 1]]:
+        movie_id = movie_ids[m]
+        for c in mp_indices[mp_indptr[m]:mp_indptr[m + 1]]:
+            if c != pidx:
+                pairs.append((movie_id, person_ids[c]))
+    return pairs
+
+
+def _bfs_python(src: int, tgt: int):
+    """Bidirectional BFS over the CSR arrays in pure Python.
+
+    Summary:
+        Fallback used when Numba is not installed. Expands the smaller
+        frontier a full layer at a time from both endpoints until the
+        searches meet.
+    Params:
+        src: Integer index of the source person.
+        tgt: Integer index of the target person.
+    Outputs:
+        Tuple (meet, touched_people, touched_movies) where meet is the
+        meeting person index or -1 if the actors are unconnected, and
+        the touched lists record which scratch entries need resetting.
+    """
+    # One parent/action array pair per search direction, indexed by
+    # person index. The seen byte-maps guard membership since -1 marks
+    # both "unvisited" and "search root": one indexed load per probe,
+    # no hash-table pointer chasing, and the whole map stays in cache.
+    # The per-direction visited-movie maps mean that once a direction
+    # has enumerated a movie's cast, franchise co-stars sharing that
+    # movie never trigger a re-scan; kept per side so neither search
+    # misses the edges it needs to meet the other.
+    sc = _scratch
+    parent_s, parent_t = sc["parent_s"], sc["parent_t"]
+    action_s, action_t = sc["action_s"], sc["action_t"]
+    seen_s, seen_t = sc["seen_s"], sc["seen_t"]
+    seen_movies_s, seen_movies_t = sc["seen_movies_s"], sc["seen_movies_t"]
+    seen_s[src] = 1
+    seen_t[tgt] = 1
+    touched_people: List[np.ndarray] = [np.array([src, tgt], dtype=np.int32)]
+    touched_movies: List[int] = []
+    frontier_s: List[int] = [src]
+    frontier_t: List[int] = [tgt]
+
+    meet = -1
+    while frontier_s and frontier_t and meet < 0:
+        if len(frontier_s) <= len(frontier_t):
+            frontier_s, meet = _expand_layer(
+                frontier_s, parent_s, action_s, seen_s, seen_t,
+                seen_movies_s, touched_people, touched_movies)
+        else:
+            frontier_t, meet = _expand_layer(
+                frontier_t, parent_t, action_t, seen_t, seen_s,
+                seen_movies_t, touched_people, touched_movies)
+
+    return meet, touched_people, touched_movies
+
+
+def _expand_layer(frontier, parent, action, seen, other, seen_movies,
+                  touched_people, touched_movies):
+    """Expand one BFS layer of one search direction.
+
+    Summary:
+        Level-synchronous step: collects every co-star reachable from
+        the layer into one deduplicated batch (first arrival keeps its
+        parent/movie, which preserves shortest paths), then prunes the
+        batch against the seen map and tests for a meeting point with
+        vectorized NumPy indexing instead of per-element probes.
+    Params:
+        frontier: List of person indices forming the current layer.
+        parent: This direction's parent array, updated in place.
+        action: This direction's movie-label array, updated in place.
+        seen: This direction's uint8 person byte-map, updated in place.
+        other: The opposite direction's seen byte-map, for meet tests.
+        seen_movies: This direction's uint8 movie byte-map.
+        touched_people: List collecting the arrays of newly seen person
+            indices, so the caller can reset only those scratch entries.
+        touched_movies: List collecting newly marked movie indices.
+    Outputs:
+        Tuple (next_layer, meet) where meet is the meeting person index
+        or -1 if the searches have not met yet.
     """
-    neighbor_pairs: Set[Tuple[str, str]] = set()
-    for movie_id in people[person_id]["movies"]:
-        for star_id in movies[movie_id]["stars"]:
-            neighbor_pairs.add((movie_id, star_id))
-    return neighbor_pairs
+    layer_costars: Dict[int, Tuple[int, int]] = {}
+    for current in frontier:
+        for m in pm_indices[pm_indptr[current]:pm_indptr[current + 1]]:
+            m = int(m)
+            if seen_movies[m]:
+                continue
+            seen_movies[m] = 1
+            touched_movies.append(m)
+            for c in mp_indices[mp_indptr[m]:mp_indptr[m + 1]]:
+                layer_costars.setdefault(int(c), (current, m))
+    if not layer_costars:
+        return [], -1
+
+    # Prune already-seen candidates in one gather instead of a Python
+    # membership check per co-star.
+    candidates = np.fromiter(
+        layer_costars, count=len(layer_costars), dtype=np.int32)
+    new = candidates[seen[candidates] == 0]
+    seen[new] = 1
+    touched_people.append(new)
+    for c in new:
+        c = int(c)
+        parent[c], action[c] = layer_costars[c]
+
+    meets = new[other[new] != 0]
+    if meets.size:
+        return [], int(meets[0])
+    return [int(c) for c in new], -1
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _bfs_kernel(src, tgt, pm_ptr, pm_idx, mp_ptr, mp_idx,
+                    parent_s, parent_t, action_s, action_t,
+                    cur_s, nxt_s, cur_t, nxt_t,
+                    seen_movies_s, seen_movies_t, touched_p, touched_m):
+        """Bidirectional BFS compiled by Numba over the CSR arrays.
+
+        Same search as _bfs_python, but over the caller's preallocated
+        int32 scratch arrays with manual layer bookkeeping so the whole
+        search compiles to a tight integer loop. The search roots are
+        marked with self-parents so parent[c] == -1 doubles as the seen
+        test, and per-direction movie byte-maps skip casts a direction
+        has already enumerated. Every person/movie index the search
+        dirties is logged in touched_p/touched_m; returns
+        (meet, n_touched_p, n_touched_m) so the caller can reset just
+        those entries afterwards.
+        """
+        parent_s[src] = src
+        parent_t[tgt] = tgt
+        touched_p[0] = src
+        touched_p[1] = tgt
+        n_tp = 2
+        n_tm = 0
+        cur_s[0] = src
+        cur_t[0] = tgt
+        n_s = 1
+        n_t = 1
+
+        meet = -1
+        while n_s > 0 and n_t > 0 and meet < 0:
+            if n_s <= n_t:
+                parent, action, other, cur, nxt, n, seen_movies = (
+                    parent_s, action_s, parent_t, cur_s, nxt_s, n_s,
+                    seen_movies_s)
+            else:
+                parent, action, other, cur, nxt, n, seen_movies = (
+                    parent_t, action_t, parent_s, cur_t, nxt_t, n_t,
+                    seen_movies_t)
+
+            count = 0
+            for i in range(n):
+                current = cur[i]
+                for j in range(pm_ptr[current], pm_ptr[current + 1]):
+                    m = pm_idx[j]
+                    if seen_movies[m]:
+                        continue
+                    seen_movies[m] = 1
+                    touched_m[n_tm] = m
+                    n_tm += 1
+                    for k in range(mp_ptr[m], mp_ptr[m + 1]):
+                        c = mp_idx[k]
+                        if parent[c] != -1:
+                            continue
+                        parent[c] = current
+                        action[c] = m
+                        touched_p[n_tp] = c
+                        n_tp += 1
+                        if other[c] != -1:
+                            meet = c
+                            break
+                        nxt[count] = c
+                        count += 1
+                    if meet >= 0:
+                        break
+                if meet >= 0:
+                    break
+
+            if n_s <= n_t:
+                cur_s, nxt_s = nxt_s, cur_s
+                n_s = count
+            else:
+                cur_t, nxt_t = nxt_t, cur_t
+                n_t = count
+
+        return meet, n_tp, n_tm
+
+
+def _reset_scratch(touched_people, touched_movies) -> None:
+    """Restore the scratch-buffer invariant after a search.
+
+    Summary:
+        Sets parent entries back to -1 and seen byte-map entries back
+        to 0, but only at the indices the last search dirtied -- an
+        O(visited) sweep instead of reinitializing whole arrays.
+    Params:
+        touched_people: Person indices visited by either direction.
+        touched_movies: Movie indices marked by either direction.
+    Outputs:
+        None; the module-level scratch arrays are updated in place.
+    """
+    sc = _scratch
+    sc["parent_s"][touched_people] = -1
+    sc["parent_t"][touched_people] = -1
+    sc["seen_s"][touched_people] = 0
+    sc["seen_t"][touched_people] = 0
+    sc["seen_movies_s"][touched_movies] = 0
+    sc["seen_movies_t"][touched_movies] = 0
 
 
 def shortest_path(source: str, target: str) -> Optional[List[Tuple[str, str]]]:
-    """Use BFS to find the shortest actor/film chain from source to target.
+    """Use bidirectional BFS to find the shortest actor/film chain.
 
     Summary:
-        Expands a breadth-first frontier over the person graph until the
-        target actor is found, then reconstructs the path of (movie, person)
-        steps from source to target.
+        Grows one breadth-first search from the source and another from
+        the target, always expanding the smaller frontier by a full
+        layer. When the two searches meet, the half-paths are spliced
+        into a single chain of (movie, person) steps. Meeting in the
+        middle explores O(2*b^(d/2)) nodes instead of O(b^d).
     Params:
         source: Person id for the starting actor.
         target: Person id for the destination actor.
@@ -122,30 +461,56 @@ def shortest_path(source: str, target: str) -> Optional[List[Tuple[str, str]]]:
         Ordered list of (movie_id, person_id) tuples representing each step,
         or None if no connection exists.
     """
-    start = Node(state=source, parent=None, action=None)
-    frontier = QueueFrontier()
-    frontier.add(start)
-    explored: Set[str] = set()
+    if source == target:
+        return []
 
-    while not frontier.empty():
-        node = frontier.remove()
-        explored.add(node.state)
+    src = person_index[source]
+    tgt = person_index[target]
 
-        for movie_id, person_id in neighbors_for_person(node.state):
-            if person_id in explored or frontier.contains_state(person_id):
-                continue
-            child = Node(state=person_id, parent=node, action=movie_id)
-            if person_id == target:
-                # Reconstruct path
-                chain: List[Tuple[str, str]] = []
-                while child.parent is not None:
-                    chain.append((child.action, child.state))
-                    child = child.parent
-                chain.reverse()
-                return chain
-            frontier.add(child)
+    sc = _scratch
+    if njit is not None:
+        meet, n_tp, n_tm = _bfs_kernel(
+            src, tgt, pm_indptr, pm_indices, mp_indptr, mp_indices,
+            sc["parent_s"], sc["parent_t"], sc["action_s"], sc["action_t"],
+            sc["cur_s"], sc["nxt_s"], sc["cur_t"], sc["nxt_t"],
+            sc["seen_movies_s"], sc["seen_movies_t"],
+            sc["touched_p"], sc["touched_m"])
+        touched_people = sc["touched_p"][:n_tp]
+        touched_movies = sc["touched_m"][:n_tm]
+    else:
+        meet, touched_lists, touched_m_list = _bfs_python(src, tgt)
+        touched_people = np.concatenate(touched_lists)
+        touched_movies = np.array(touched_m_list, dtype=np.int32)
+
+    parent_s, parent_t = sc["parent_s"], sc["parent_t"]
+    action_s, action_t = sc["action_s"], sc["action_t"]
+    try:
+        if meet < 0:
+            return None
+
+        # Walk the parent arrays with integer ops only; the string ids
+        # are looked up once at the end rather than inside the walk.
+        # Source half: back from the meeting point to the source.
+        steps: List[Tuple[int, int]] = []
+        step = meet
+        while step != src:
+            steps.append((int(action_s[step]), step))
+            step = int(parent_s[step])
+        steps.reverse()
+
+        # Target half: each action_t[x] is the movie linking x to its
+        # target-side parent, so walking forward yields the remaining
+        # steps.
+        step = meet
+        while step != tgt:
+            nxt = int(parent_t[step])
+            steps.append((int(action_t[step]), nxt))
+            step = nxt
 
-    return None
+        return [(movie_ids[m], person_ids[p]) for m, p in steps]
+    finally:
+        # The scratch buffers must be clean before the next query.
+        _reset_scratch(touched_people, touched_movies)
 
 
 def main() -> None:
@@ -183,9 +548,9 @@ def main() -> None:
     print(f"Degrees of separation: {len(path)}")
     current = source_id
     for i, (movie_id, person_id) in enumerate(path, start=1):
-        movie = movies[movie_id]["title"]
-        actor_from = people[current]["name"]
-        actor_to = people[person_id]["name"]
+        movie = movies[movie_id][0]
+        actor_from = people[current][0]
+        actor_to = people[person_id][0]
         print(f"{i}: {actor_from} acted with {actor_to} in {movie}")
         current = person_id
 
@@ -1,3 +1,6 @@
+from collections import deque
+
+
 class Node:
     """Search tree node used by frontier implementations."""
 
@@ -24,27 +27,29 @@ class StackFrontier:
 
     def __init__(self):
         """Initialize an empty frontier."""
-        self.frontier = []
+        self.frontier = deque()
+        self.states = set()
 
     def add(self, node):
         """Push a node onto the frontier."""
         self.frontier.append(node)
+        self.states.add(node.state)
 
     def contains_state(self, state):
         """Return True if a node with the given state is already present."""
-        return any(node.state == state for node in self.frontier)
+        return state in self.states
 
     def empty(self):
         """Return True when no nodes remain in the frontier."""
-        return len(self.frontier) == 0
+        return not self.frontier
 
     def remove(self):
         """Pop and return the most recently added node."""
         if self.empty():
             raise Exception("empty frontier")
         else:
-            node = self.frontier[-1]
-            self.frontier = self.frontier[:-1]
+            node = self.frontier.pop()
+            self.states.discard(node.state)
             return node
 
 
@@ -55,6 +60,6 @@ class QueueFrontier(StackFrontier):
         if self.empty():
             raise Exception("empty frontier")
         else:
-            node = self.frontier[0]
-            self.frontier = self.frontier[1:]
+            node = self.frontier.popleft()
+            self.states.discard(node.state)
             return node